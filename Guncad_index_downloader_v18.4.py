@@ -4,7 +4,7 @@ Based on v5 Intent-Based Organization with new features:
 - Real-time failed downloads counter
 - Configurable output directory at startup
 - Adjustable download timeout with explanations
-- Batch Excel updates every N downloads
+- Index rows journaled every N downloads; Excel index written at the end of a run
 - Estimated time remaining (ETA) indicator
 - LBRY URL tracking in Excel for reliable duplicate detection
 - Full description, notes, and readme fields (not truncated)
@@ -70,39 +70,222 @@ import os
 import re
 import time
 import json
+import atexit
+import sqlite3
+import bisect
 import hashlib
 import zipfile
+import functools
+import threading
 import shutil
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 from urllib.parse import urljoin, urlparse, unquote, parse_qs
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Characters that are not allowed in file names on Windows
+_SANITIZE_RE = re.compile(r'[<>:"/\\|?*]')
+# Case-sensitive title keywords used to route tools and jigs
+_TOOL_TITLE_RE = re.compile(r'Jig|Fixture|Bending|Drill|CNC')
+# Any path component starting with a dot (hidden folders are not documented)
+_HIDDEN_PATH_RE = re.compile(r'(?:^|[\\/])\.')
+# Comma separator for the tag filter prompt, swallowing the spaces around it
+_TAG_SPLIT_RE = re.compile(r'\s*,\s*')
+
+# Maps every control character below ASCII 32 (including tab/newline/return) to a space
+_EXCEL_CONTROL_TO_SPACE = {c: ' ' for c in range(32)}
+
+# Folder-name forms of calibers ('.45 ACP' -> '45_ACP') and gun models ('Glock 19' -> 'Glock_19')
+_CALIBER_FOLDER_TABLE = str.maketrans({' ': '_', '.': None})
+_MODEL_FOLDER_TABLE = str.maketrans({' ': '_'})
+
+# Extensions FileVerifier reports as recognised design/document formats
+_CAD_FORMATS = frozenset({
+    '.stl', '.step', '.stp', '.3mf', '.obj', '.f3d',
+    '.blend', '.scad', '.dxf', '.dwg', '.iges', '.igs',
+    '.pdf', '.txt', '.md', '.gcode', '.rar', '.7z'
+})
+
+# Files the downloader writes itself; never treated as downloaded content
+_GENERATED_FILES = frozenset({
+    'download_history.json', 'download_history.json.bak', 'download_history.db',
+    'download_history.db-wal', 'download_history.db-shm', 'GunCAD_Master_Index.xlsx',
+    'GunCAD_Master_Index.csv', 'GunCAD_Master_Index.pending.csv', 'QUICK_FIND.txt',
+    'README.md'
+})
+
+
+def scan_files(path):
+    """Recursively yield os.DirEntry objects for every file under path"""
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                yield from scan_files(entry.path)
+            elif entry.is_file():
+                yield entry
+        except OSError:
+            pass
+
+
+def _safe_size(path):
+    """Return the size of path with a single stat, or None if it is missing"""
+    if not path:
+        return None
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return None
+
+
+def index_files(path, skip=()):
+    """Map each file name under path to a list of {'path', 'size'} matches"""
+    files_by_name = {}
+    for entry in scan_files(path):
+        if entry.name in skip:
+            continue
+
+        try:
+            file_size = entry.stat().st_size
+        except OSError:
+            continue
+
+        if entry.name not in files_by_name:
+            files_by_name[entry.name] = []
+        files_by_name[entry.name].append({
+            'path': entry.path,
+            'size': file_size
+        })
+
+    return files_by_name
+
+
+@functools.lru_cache(maxsize=1)
+def _format_minute(minute):
+    return datetime.fromtimestamp(minute * 60).strftime('%Y-%m-%d %H:%M')
+
+
+def minute_timestamp():
+    """Current local time as 'YYYY-MM-DD HH:MM', formatted once per minute"""
+    return _format_minute(int(time.time() // 60))
 
 
 class DownloadTracker:
     """Tracks downloaded files using LBRY URLs as unique identifiers"""
     
+    # Commit history to disk every N marks instead of after each one
+    HISTORY_SAVE_INTERVAL = 20
+    
     def __init__(self, output_dir, excel_index=None):
         self.output_dir = output_dir
+        self._output_abs = os.path.abspath(output_dir)
         self.excel_index = excel_index
-        self.db_file = os.path.join(output_dir, 'download_history.json')
-        self.history = self.load_history()
+        self._lbry_index = {}
+        for entry in excel_index or []:
+            if entry.get('LBRY URL'):
+                self._lbry_index.setdefault(entry['LBRY URL'], entry)
+        self.db_file = os.path.join(output_dir, 'download_history.db')
+        # Older versions kept history in one JSON file
+        self.legacy_history_file = os.path.join(output_dir, 'download_history.json')
         self.filesystem_cache = None
+        self._normalized_cache = None
+        self._dirty_count = 0
+        # Zip checks read the whole file, so run them while the next download starts
+        self._verify_pool = ThreadPoolExecutor(max_workers=2)
+        self._pending_verifications = []
+        # Entries are processed on several threads; the lock serializes the
+        # shared connection, transaction state and filesystem cache
+        self._lock = threading.RLock()
+        self._db = self.open_history()
+        atexit.register(self.flush_history)
+        self.migrate_legacy_history()
+
+    def open_history(self):
+        db = sqlite3.connect(self.db_file, isolation_level=None, check_same_thread=False)
+        db.execute('PRAGMA journal_mode=WAL')
+        db.execute('PRAGMA synchronous=NORMAL')
+        db.execute('''CREATE TABLE IF NOT EXISTS history (
+            entry_id TEXT PRIMARY KEY,
+            status TEXT,
+            verified INTEGER,
+            lbry_url TEXT,
+            json TEXT
+        )''')
+        db.execute('CREATE INDEX IF NOT EXISTS idx_history_lbry ON history(lbry_url)')
+        return db
+
+    def _load_json(self, path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except:
+            return {}
 
-    def load_history(self):
-        if os.path.exists(self.db_file):
-            try:
-                with open(self.db_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                return {}
-        return {}
+    def migrate_legacy_history(self):
+        """Import download_history.json into the database"""
+        if not os.path.isfile(self.legacy_history_file):
+            return
+        
+        imported = 0
+        self._db.execute('BEGIN')
+        for entry_id, record in self._load_json(self.legacy_history_file).items():
+            self._write_record(entry_id, record, replace=False)
+            imported += 1
+        self._db.execute('COMMIT')
+        
+        os.replace(self.legacy_history_file, self.legacy_history_file + '.bak')
+        print(f"  ✓ Migrated {imported} history records to '{self.db_file}'")
 
     def save_history(self):
-        with open(self.db_file, 'w', encoding='utf-8') as f:
-            json.dump(self.history, f, indent=2, ensure_ascii=False)
+        """Commit the pending batch of marks"""
+        with self._lock:
+            if self._db.in_transaction:
+                self._db.execute('COMMIT')
+            self._dirty_count = 0
+
+    def flush_history(self):
+        """Save history if any marks are still pending"""
+        with self._lock:
+            if self._dirty_count:
+                self.save_history()
+
+    def _write_record(self, entry_id, record, replace=True):
+        verb = 'INSERT OR REPLACE' if replace else 'INSERT OR IGNORE'
+        self._db.execute(
+            f'{verb} INTO history (entry_id, status, verified, lbry_url, json) VALUES (?, ?, ?, ?, ?)',
+            (entry_id, record.get('status', 'downloaded'), int(bool(record.get('verified', False))),
+             record.get('lbry_url') or None, json.dumps(record, ensure_ascii=False)))
+
+    def _set_record(self, entry_id, record):
+        with self._lock:
+            if not self._db.in_transaction:
+                self._db.execute('BEGIN')
+            self._write_record(entry_id, record)
+            
+            self._dirty_count += 1
+            if self._dirty_count >= self.HISTORY_SAVE_INTERVAL:
+                self.save_history()
+
+    def _get_record(self, entry_id=None, lbry_url=None):
+        with self._lock:
+            if entry_id is not None:
+                row = self._db.execute('SELECT json FROM history WHERE entry_id = ?', (entry_id,)).fetchone()
+            else:
+                row = self._db.execute('SELECT json FROM history WHERE lbry_url = ? LIMIT 1', (lbry_url,)).fetchone()
+        return json.loads(row[0]) if row else None
 
-    def get_entry_id(self, detail_url):
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def get_entry_id(detail_url):
+        # MD5 is kept so existing download_history keys stay valid; the
+        # same detail URL is hashed by is_downloaded and again by mark_*
         return hashlib.md5(detail_url.encode()).hexdigest()
     
     def build_filesystem_cache(self):
@@ -110,64 +293,58 @@ class DownloadTracker:
         if self.filesystem_cache is not None:
             return
         
-        self.filesystem_cache = {}
         print(f"\n  🔍 Scanning '{self.output_dir}' for existing files...")
         
-        file_count = 0
-        for root, dirs, files in os.walk(self.output_dir):
-            for filename in files:
-                if filename in ['download_history.json', 'GunCAD_Master_Index.xlsx', 
-                               'GunCAD_Master_Index.csv', 'QUICK_FIND.txt', 'README.md']:
-                    continue
-                
-                filepath = os.path.join(root, filename)
-                try:
-                    file_size = os.path.getsize(filepath)
-                    if filename not in self.filesystem_cache:
-                        self.filesystem_cache[filename] = []
-                    self.filesystem_cache[filename].append({
-                        'path': filepath,
-                        'size': file_size
-                    })
-                    file_count += 1
-                except:
-                    pass
+        self.filesystem_cache = index_files(self.output_dir, skip=_GENERATED_FILES)
+        file_count = sum(len(matches) for matches in self.filesystem_cache.values())
+        
+        # Normalized base name -> first cached file name, for fuzzy lookups
+        self._normalized_cache = {}
+        for cached_name in self.filesystem_cache:
+            self._add_normalized_name(cached_name)
         
         print(f"  ✓ Found {file_count} existing files")
         if file_count > 0:
             print(f"  📋 Sample files: {list(self.filesystem_cache.keys())[:5]}")
         print()
 
+    def _add_normalized_name(self, cached_name):
+        cached_base = os.path.splitext(cached_name)[0]
+        normalized_cached = cached_base.lower().replace('-', ' ').replace('_', ' ')
+        self._normalized_cache.setdefault(normalized_cached, cached_name)
+
     def is_downloaded(self, detail_url, lbry_url=None, expected_size=0):
         """Check if file exists using Excel index (by LBRY URL) - ONLY in current output directory"""
         
-        if self.excel_index and lbry_url:
-            for entry in self.excel_index:
-                if entry.get('LBRY URL') == lbry_url:
-                    filepath = entry.get('Location', '')
-                    if filepath and os.path.exists(filepath):
-                        try:
-                            file_abs = os.path.abspath(filepath)
-                            output_abs = os.path.abspath(self.output_dir)
-                            rel_path = os.path.relpath(file_abs, output_abs)
-                            
-                            if rel_path.startswith('..'):
-                                print(f"    ⚠ File exists but outside '{self.output_dir}', will re-download")
-                                return False
-                            
-                            print(f"    ✓ Found in index: {os.path.basename(filepath)}")
-                            return True
-                        except ValueError:
-                            print(f"    ⚠ File on different drive, will re-download")
-                            return False
-                    else:
-                        print(f"    ⚠ In index but file missing, will re-download")
+        entry = self._lbry_index.get(lbry_url) if lbry_url else None
+        if entry is not None:
+            filepath = entry.get('Location', '')
+            if filepath and os.path.exists(filepath):
+                try:
+                    file_abs = os.path.abspath(filepath)
+                    rel_path = os.path.relpath(file_abs, self._output_abs)
+                    
+                    if rel_path.startswith('..'):
+                        print(f"    ⚠ File exists but outside '{self.output_dir}', will re-download")
                         return False
+                    
+                    print(f"    ✓ Found in index: {os.path.basename(filepath)}")
+                    return True
+                except ValueError:
+                    print(f"    ⚠ File on different drive, will re-download")
+                    return False
+            else:
+                print(f"    ⚠ In index but file missing, will re-download")
+                return False
         
         entry_id = self.get_entry_id(detail_url)
         
-        if entry_id in self.history:
-            entry = self.history[entry_id]
+        entry = self._get_record(entry_id)
+        if entry is None and lbry_url:
+            # Same release recorded under a different detail URL
+            entry = self._get_record(lbry_url=lbry_url)
+        
+        if entry is not None:
             
             if entry.get('status') == 'failed':
                 return False
@@ -176,8 +353,7 @@ class DownloadTracker:
             if stored_filepath and os.path.exists(stored_filepath):
                 try:
                     file_abs = os.path.abspath(stored_filepath)
-                    output_abs = os.path.abspath(self.output_dir)
-                    rel_path = os.path.relpath(file_abs, output_abs)
+                    rel_path = os.path.relpath(file_abs, self._output_abs)
                     
                     if not rel_path.startswith('..'):
                         filename = os.path.basename(stored_filepath)
@@ -188,8 +364,16 @@ class DownloadTracker:
         
         return False
     
-    def file_exists_in_cache(self, filename, expected_size=0):
-        """Check if a file with this name exists in the filesystem cache"""
+    def find_in_cache(self, filename, expected_size=0):
+        """Return the cached {'path', 'size'} record for a file, or None.
+        
+        The size comes from the directory scan, so callers can use it
+        without another stat of the file.
+        """
+        with self._lock:
+            return self._find_in_cache(filename, expected_size)
+    
+    def _find_in_cache(self, filename, expected_size):
         if self.filesystem_cache is None:
             self.build_filesystem_cache()
         
@@ -200,34 +384,35 @@ class DownloadTracker:
                 for match in matches:
                     size_diff = abs(match['size'] - expected_size)
                     if size_diff < (expected_size * 0.01):
-                        return match['path']
+                        return match
             
-            return matches[0]['path'] if matches else None
+            return matches[0] if matches else None
         
         base_filename = filename.split(':')[0] if ':' in filename else filename
         normalized_search = base_filename.lower().replace('-', ' ').replace('_', ' ')
         
-        for cached_name, matches in self.filesystem_cache.items():
-            cached_base = os.path.splitext(cached_name)[0]
-            normalized_cached = cached_base.lower().replace('-', ' ').replace('_', ' ')
+        cached_name = self._normalized_cache.get(normalized_search)
+        if cached_name is not None:
+            matches = self.filesystem_cache[cached_name]
             
-            if normalized_search == normalized_cached:
-                if expected_size > 0:
-                    for match in matches:
-                        size_diff = abs(match['size'] - expected_size)
-                        if size_diff < (expected_size * 0.01):
-                            return match['path']
-                
-                return matches[0]['path'] if matches else None
+            if expected_size > 0:
+                for match in matches:
+                    size_diff = abs(match['size'] - expected_size)
+                    if size_diff < (expected_size * 0.01):
+                        return match
+            
+            return matches[0] if matches else None
         
         return None
 
     def mark_downloaded(self, detail_url, title, filepath, tags, verified=False, 
-                       file_size=0, category=None, gun_model=None, caliber=None):
+                       file_size=0, category=None, gun_model=None, caliber=None,
+                       lbry_url=''):
         entry_id = self.get_entry_id(detail_url)
-        self.history[entry_id] = {
+        self._set_record(entry_id, {
             'title': title,
             'detail_url': detail_url,
+            'lbry_url': lbry_url,
             'filepath': filepath,
             'tags': tags,
             'downloaded_at': datetime.now().isoformat(),
@@ -237,36 +422,89 @@ class DownloadTracker:
             'category': category,
             'gun_model': gun_model,
             'caliber': caliber
-        }
-        self.save_history()
+        })
         
-        if self.filesystem_cache is not None:
-            filename = os.path.basename(filepath)
-            if filename not in self.filesystem_cache:
-                self.filesystem_cache[filename] = []
-            self.filesystem_cache[filename].append({
-                'path': filepath,
-                'size': file_size
-            })
+        with self._lock:
+            if self.filesystem_cache is not None:
+                filename = os.path.basename(filepath)
+                if filename not in self.filesystem_cache:
+                    self.filesystem_cache[filename] = []
+                    self._add_normalized_name(filename)
+                self.filesystem_cache[filename].append({
+                    'path': filepath,
+                    'size': file_size
+                })
 
     def mark_failed(self, detail_url, title, reason, lbry_url=''):
         entry_id = self.get_entry_id(detail_url)
-        self.history[entry_id] = {
+        self._set_record(entry_id, {
             'title': title,
             'detail_url': detail_url,
             'lbry_url': lbry_url,
             'status': 'failed',
             'reason': reason,
             'failed_at': datetime.now().isoformat()
-        }
-        self.save_history()
+        })
+
+    def submit_verification(self, detail_url, title, filepath, lbry_url='', deep=False):
+        """Verify a downloaded file in the background; see collect_verifications"""
+        future = self._verify_pool.submit(FileVerifier.verify_file, filepath, deep)
+        with self._lock:
+            self._pending_verifications.append((future, detail_url, title, filepath, lbry_url))
+
+    def collect_verifications(self, wait=False):
+        """Record finished background verifications and return the failed paths.
+        
+        Passing files get verified=True in the history; failing files are
+        removed and marked failed so the next run downloads them again.
+        """
+        with self._lock:
+            still_pending = []
+            failed = []
+            
+            for pending in self._pending_verifications:
+                future, detail_url, title, filepath, lbry_url = pending
+                if not wait and not future.done():
+                    still_pending.append(pending)
+                    continue
+            
+                is_valid, message = future.result()
+                if is_valid:
+                    record = self._get_record(self.get_entry_id(detail_url))
+                    if record is not None:
+                        record['verified'] = True
+                        self._set_record(self.get_entry_id(detail_url), record)
+                    continue
+            
+                print(f"  ✗ Verification failed for {title}: {message}")
+                try:
+                    os.remove(filepath)
+                except OSError:
+                    pass
+                self.mark_failed(detail_url, title, f"Verification: {message}", lbry_url=lbry_url)
+                self._forget_cached_file(filepath)
+                failed.append(filepath)
+            
+            self._pending_verifications = still_pending
+        return failed
+
+    def shutdown_verifications(self):
+        """Stop the verification pool once its last results have been collected"""
+        self._verify_pool.shutdown(wait=True)
+
+    def _forget_cached_file(self, filepath):
+        """Drop a deleted file from the filesystem cache so it is not matched again"""
+        if self.filesystem_cache is None:
+            return
+        matches = self.filesystem_cache.get(os.path.basename(filepath))
+        if matches:
+            matches[:] = [match for match in matches if match['path'] != filepath]
 
     def get_stats(self):
-        total = len(self.history)
-        successful = sum(1 for e in self.history.values() 
-                        if e.get('verified', False))
-        failed = sum(1 for e in self.history.values() 
-                    if e.get('status') == 'failed')
+        with self._lock:
+            total, successful, failed = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(verified), 0), "
+                "COALESCE(SUM(status = 'failed'), 0) FROM history").fetchone()
         return {
             'total': total,
             'successful': successful,
@@ -281,6 +519,9 @@ class LBRYDaemonClient:
         self.daemon_url = daemon_url
         self.available = False
         self.max_wait_time = max_wait_time
+        # Keep-alive session so polling does not reconnect to the daemon on every call
+        self.session = requests.Session()
+        self.session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
         self.check_connection()
 
     def check_connection(self):
@@ -307,7 +548,7 @@ class LBRYDaemonClient:
         }
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.daemon_url,
                 json=payload,
                 timeout=30
@@ -348,11 +589,10 @@ class LBRYDaemonClient:
                 print(f"  Status: {status}")
             
             if status in ('completed', 'finished'):
-                if download_path and os.path.exists(download_path):
-                    file_size = os.path.getsize(download_path)
-                    if file_size > 0:
-                        print(f"  ✓ Download complete ({file_size/1024/1024:.2f}MB)")
-                        return download_path
+                file_size = _safe_size(download_path)
+                if file_size:
+                    print(f"  ✓ Download complete ({file_size/1024/1024:.2f}MB)")
+                    return download_path
             
             if status == 'running':
                 if attempt == 0:
@@ -363,11 +603,10 @@ class LBRYDaemonClient:
                 continue
             
             if status == 'stopped':
-                if download_path and os.path.exists(download_path):
-                    file_size = os.path.getsize(download_path)
-                    if file_size > 0:
-                        print(f"  ✓ File exists ({file_size/1024/1024:.2f}MB)")
-                        return download_path
+                file_size = _safe_size(download_path)
+                if file_size:
+                    print(f"  ✓ File exists ({file_size/1024/1024:.2f}MB)")
+                    return download_path
         
         print(f"  ✗ Failed after {max_retries} attempts")
         return None
@@ -376,10 +615,12 @@ class LBRYDaemonClient:
         """Wait for download completion by monitoring progress"""
         start_time = time.time()
         last_progress = -1
+        last_print_time = 0
         last_download_path = None
         last_written_bytes = 0
         stall_start_time = None
         stall_threshold = 30  # Consider stalled if no progress for 30 seconds
+        poll_interval = 0.25  # Backs off to 4s while nothing changes
         
         print(f"  ⏳ Download in progress (monitoring for stalls)...")
         
@@ -391,7 +632,8 @@ class LBRYDaemonClient:
                 items = file_list.get('items', [])
                 
                 if not items:
-                    time.sleep(2)
+                    time.sleep(poll_interval)
+                    poll_interval = min(poll_interval * 1.5, 4.0)
                     # Check if we've been waiting too long with no items
                     if elapsed > 60:
                         print(f"\n  ✗ No download info after {elapsed}s")
@@ -412,9 +654,10 @@ class LBRYDaemonClient:
                     
                     # Check if download is making progress
                     if written > last_written_bytes:
-                        # Progress detected - reset stall timer
+                        # Progress detected - reset stall timer and poll quickly again
                         stall_start_time = None
                         last_written_bytes = written
+                        poll_interval = 0.25
                     else:
                         # No progress - check if stalled
                         if stall_start_time is None:
@@ -422,19 +665,26 @@ class LBRYDaemonClient:
                         elif time.time() - stall_start_time > stall_threshold:
                             print(f"\n  ⚠ Download stalled (no progress for {stall_threshold}s)")
                             # Check if file is complete despite stall
-                            if download_path and os.path.exists(download_path):
-                                file_size = os.path.getsize(download_path)
-                                if file_size > 0:
-                                    print(f"  ✓ File exists ({file_size/1024/1024:.2f}MB)")
-                                    return download_path
+                            file_size = _safe_size(download_path)
+                            if file_size:
+                                print(f"  ✓ File exists ({file_size/1024/1024:.2f}MB)")
+                                return download_path
                             return None
                     
-                    if total > 0:
+                    # Redraw at most once a second: on a change, or every 5s as a heartbeat
+                    since_print = time.monotonic() - last_print_time
+                    if total > 0 and since_print >= 1.0:
                         progress = int((written / total) * 100)
-                        speed = written / max(elapsed, 1) / 1024 / 1024  # MB/s
-                        if progress != last_progress or elapsed % 5 == 0:
+                        if progress != last_progress or since_print >= 5.0:
+                            speed = written / max(elapsed, 1) / 1024 / 1024  # MB/s
                             print(f"  Progress: {progress}% ({written/1024/1024:.1f}MB / {total/1024/1024:.1f}MB) - {speed:.2f} MB/s - {elapsed}s", end='\r')
                             last_progress = progress
+                            last_print_time = time.monotonic()
+                    
+                    # All bytes written - no need to wait for another poll
+                    if total > 0 and written == total and download_path and os.path.exists(download_path):
+                        print(f"\n  ✓ Download completed in {elapsed}s!")
+                        return download_path
                 
                 if status in ('completed', 'finished'):
                     print(f"\n  ✓ Download completed in {elapsed}s!")
@@ -443,11 +693,10 @@ class LBRYDaemonClient:
                 
                 elif status == 'stopped':
                     print(f"\n  Download stopped at {elapsed}s")
-                    if download_path and os.path.exists(download_path):
-                        file_size = os.path.getsize(download_path)
-                        if file_size > 0:
-                            print(f"  ✓ File complete ({file_size/1024/1024:.2f}MB)")
-                            return download_path
+                    file_size = _safe_size(download_path)
+                    if file_size:
+                        print(f"  ✓ File complete ({file_size/1024/1024:.2f}MB)")
+                        return download_path
                     return None
             else:
                 # No response from API
@@ -455,7 +704,8 @@ class LBRYDaemonClient:
                     print(f"\n  ✗ No API response after {elapsed}s")
                     return None
             
-            time.sleep(2)
+            time.sleep(poll_interval)
+            poll_interval = min(poll_interval * 1.5, 4.0)
         
         return None
 
@@ -464,10 +714,16 @@ class FileVerifier:
     """Verify files"""
     
     @staticmethod
-    def verify_zip(filepath):
+    def verify_zip(filepath, deep=False):
+        """Check a zip's central directory; deep=True also CRC-checks every member.
+        
+        filepath may be a path or an already open binary file.
+        """
         try:
             with zipfile.ZipFile(filepath, 'r') as zf:
-                result = zf.testzip()
+                # Opening already parses the central directory, which is
+                # enough to catch truncated or non-zip downloads
+                result = zf.testzip() if deep else None
                 if result is None:
                     file_count = len(zf.namelist())
                     return True, f"Valid zip with {file_count} files"
@@ -479,37 +735,27 @@ class FileVerifier:
             return False, f"Error: {e}"
     
     @staticmethod
-    def is_zip_file(filepath):
-        """Check if file is actually a zip by reading magic bytes"""
+    def verify_file(filepath, deep=False):
+        # One open() serves the size check, the magic-byte probe and the zip check
         try:
-            with open(filepath, 'rb') as f:
-                magic = f.read(4)
-                return magic[:2] == b'PK'
-        except:
-            return False
-    
-    @staticmethod
-    def verify_file(filepath):
-        if not os.path.exists(filepath):
+            f = open(filepath, 'rb')
+        except OSError:
             return False, "File not found"
         
-        file_size = os.path.getsize(filepath)
-        if file_size == 0:
-            return False, "File is empty"
-        
-        ext = os.path.splitext(filepath)[1].lower()
-        
-        if ext == '.zip' or FileVerifier.is_zip_file(filepath):
-            is_valid, message = FileVerifier.verify_zip(filepath)
-            if is_valid:
-                return True, message
-            return True, f"File downloaded ({file_size/1024/1024:.2f}MB) - may not be standard zip"
-        
-        cad_formats = ['.stl', '.step', '.stp', '.3mf', '.obj', '.f3d', 
-                      '.blend', '.scad', '.dxf', '.dwg', '.iges', '.igs',
-                      '.pdf', '.txt', '.md', '.gcode', '.rar', '.7z']
+        with f:
+            file_size = os.fstat(f.fileno()).st_size
+            if file_size == 0:
+                return False, "File is empty"
+            
+            ext = os.path.splitext(filepath)[1].lower()
+            
+            if ext == '.zip' or f.read(2) == b'PK':
+                is_valid, message = FileVerifier.verify_zip(f, deep=deep)
+                if is_valid:
+                    return True, message
+                return True, f"File downloaded ({file_size/1024/1024:.2f}MB) - may not be standard zip"
         
-        if ext in cad_formats:
+        if ext in _CAD_FORMATS:
             return True, f"Valid {ext.upper()} file ({file_size/1024/1024:.2f}MB)"
         
         return True, f"File downloaded ({file_size/1024/1024:.2f}MB)"
@@ -521,6 +767,8 @@ class GunCADIndexAPIClient:
         self.api_base = api_base
         self.api_delay = api_delay
         self.last_request_time = 0
+        self._rate_limit_lock = threading.Lock()
+        self.tags_etag = None
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 tiaga/1.0',
@@ -528,40 +776,68 @@ class GunCADIndexAPIClient:
         })
 
     def _wait_for_rate_limit(self):
-        """Ensure minimum delay between API requests"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.api_delay:
-            time.sleep(self.api_delay - elapsed)
-        self.last_request_time = time.time()
-
-    def get_all_tags(self, scan_pages=5):
-        """Fetch all available tags by scanning releases"""
+        """Ensure minimum delay between API requests (safe to call from worker threads)"""
+        with self._rate_limit_lock:
+            elapsed = time.time() - self.last_request_time
+            if elapsed < self.api_delay:
+                time.sleep(self.api_delay - elapsed)
+            self.last_request_time = time.time()
+
+    def get_all_tags(self, scan_pages=5, etag=None):
+        """Fetch all available tags by scanning releases.
+        
+        When etag is given, page 1 is requested conditionally first and None
+        is returned if the server answers 304 Not Modified. The ETag of the
+        latest page 1 response is kept in self.tags_etag.
+        """
         print(f"  Scanning first {scan_pages} pages of releases to find all tags...")
 
         all_tags = set()
 
-        try:
-            for page in range(1, scan_pages + 1):
-                self._wait_for_rate_limit()  # Add rate limiting
+        def fetch_page(page, headers=None):
+            self._wait_for_rate_limit()  # Requests still start api_delay apart
+
+            offset = (page - 1) * 30
+            url = f"{self.api_base}/releases/?limit=25&offset={offset}"
+
+            response = self.session.get(url, headers=headers, timeout=30)
+            if response.status_code == 304:
+                return None
+            response.raise_for_status()
+
+            if page == 1:
+                self.tags_etag = response.headers.get('ETag')
+            return response.json()
 
-                offset = (page - 1) * 30
-                url = f"{self.api_base}/releases/?limit=25&offset={offset}"
+        def add_tags(data):
+            if 'results' in data:
+                for entry in data['results']:
+                    if 'tags' in entry:
+                        for tag in entry.get('tags', []):
+                            if isinstance(tag, dict) and tag.get('name'):
+                                all_tags.add(tag.get('name'))
 
-                response = self.session.get(url, timeout=30)
-                response.raise_for_status()
+        try:
+            first_page = 1
+            if etag:
+                data = fetch_page(1, headers={'If-None-Match': etag})
+                if data is None:
+                    print("  Tags unchanged since the last scan")
+                    return None
+                add_tags(data)
+                first_page = 2
 
-                data = response.json()
+            # Pages are independent, so overlap their network round-trips
+            pages = range(first_page, scan_pages + 1)
+            with ThreadPoolExecutor(max_workers=max(1, min(len(pages), 8))) as executor:
+                futures = [executor.submit(fetch_page, page) for page in pages]
 
-                if 'results' in data:
-                    for entry in data['results']:
-                        if 'tags' in entry:
-                            for tag in entry.get('tags', []):
-                                if isinstance(tag, dict) and tag.get('name'):
-                                    all_tags.add(tag.get('name'))
+                for done, future in enumerate(as_completed(futures), first_page):
+                    add_tags(future.result())
 
-                # Show progress
-                if page % 2 == 0:
-                    print(f"  Scanned {page * 25} releases, found {len(all_tags)} unique tags so far...")
+                    # Show progress
+                    if done % 2 == 0:
+                        print(f"  Scanned {done * 25} releases, found {len(all_tags)} unique tags so far...")
 
             return sorted(list(all_tags))
 
@@ -649,20 +925,131 @@ class IntentBasedOrganizer:
         'Notes', 'Notes (cont.)',
         'Readme', 'Readme (cont.)'
     ]
+    
+    # Tag-triggered rules with their own folder logic, highest priority first:
+    # (any of these tags, handler method name)
+    TAG_RULES = (
+        (frozenset({'FRT', 'Trigger'}), '_categorize_fire_control'),
+        (frozenset({'Barrel', 'Bolt', 'DIY Barrel'}), '_categorize_barrel'),
+        (frozenset({'Suppressor'}), '_categorize_suppressor'),
+        (frozenset({'Magazine'}), '_categorize_magazine'),
+    )
+    
+    # Tag-only accessory rules, checked after TAG_RULES:
+    # (any of these tags, folder, part type label, use identified part type first)
+    CATEGORY_RULES = (
+        (frozenset({'Sight', 'Optic'}), "Accessories/By_Function/Optics_and_Sights",
+         'Optic/Sight', False),
+        (frozenset({'Muzzle Device'}), "Accessories/By_Function/Muzzle_Devices",
+         'Muzzle Device', False),
+        (frozenset({'Stock', 'Grip', 'Pistol Brace'}), "Accessories/By_Function/Grips_and_Stocks",
+         'Stock/Grip', True),
+        (frozenset({'Furniture', 'Handguard', 'Foregrip'}), "Furniture",
+         'Furniture', False),
+    )
+
+    # Tags (or lower-cased title words) that mark a complete build
+    COMPLETE_INDICATORS = frozenset({
+        'Complete', 'Full Build', 'Full Gun', 'DIY Fire Control',
+        'DIY Bolt', 'Printed Firearm', 'No Firearm Parts'
+    })
+    _COMPLETE_INDICATORS_LOWER = tuple(indicator.lower() for indicator in COMPLETE_INDICATORS)
+    # A frame tag plus any other major part tag also counts as a complete build
+    FRAME_TAGS = frozenset({'Frame/Receiver', 'Frame', 'Receiver'})
+    OTHER_PART_TAGS = frozenset({'Upper', 'Barrel', 'Bolt', 'Slide'})
+    
+    # Keyword tables in priority order; the first matching entry wins
+    GUN_MODELS = {
+        'Glock 19': ['Glock 19'],
+        'Glock 17': ['Glock 17'],
+        'Glock 26': ['Glock 26'],
+        'Glock 43': ['Glock 43'],
+        'Glock 48': ['Glock 48'],
+        'Glock': ['Glock'],
+        'AR-15': ['AR-15'],
+        'AR-22': ['AR-22'],
+        'AR-10': ['AR-10'],
+        'AK-47': ['AK-47', 'AK-74'],
+        'FGC-9': ['FGC-9'],
+        '1911': ['1911'],
+        'TX22': ['TX22'],
+        'Taurus': ['Taurus']
+    }
+    
+    CALIBERS = ['9x19mm', '22 Long Rifle', '.45 ACP', '5.56x45mm', 
+               '7.62x39mm', '.308 Winchester', '12 Gauge']
+    
+    PART_TYPES = {
+        'Frame': ['Frame/Receiver', 'Frame'],
+        'Receiver': ['Receiver'],
+        'Lower': ['Lower'],
+        'Upper': ['Upper'],
+        'Slide': ['Slide'],
+        'Barrel': ['Barrel', 'DIY Barrel'],
+        'Bolt': ['Bolt', 'DIY Bolt'],
+        'Trigger': ['Trigger'],
+        'Stock': ['Stock'],
+        'Grip': ['Grip', 'Pistol Grip'],
+        'Magazine': ['Magazine'],
+        'Suppressor': ['Suppressor'],
+    }
+    
+    # Exact tag -> (priority, name) lookups built from the tables above
+    _MODEL_BY_TAG = {keyword: (priority, name)
+                     for priority, (name, keywords) in enumerate(GUN_MODELS.items())
+                     for keyword in keywords}
+    _CALIBER_PRIORITY = {cal: priority for priority, cal in enumerate(CALIBERS)}
+    _PART_TYPE_BY_TAG = {keyword: (priority, name)
+                         for priority, (name, keywords) in enumerate(PART_TYPES.items())
+                         for keyword in keywords}
+    _PART_TYPE_BY_TITLE = {keyword.lower(): value for keyword, value in _PART_TYPE_BY_TAG.items()}
+    # Lookahead so overlapping keywords ('pistol grip' and 'grip') are all found
+    _PART_TYPE_TITLE_RE = re.compile('(?=(%s))' % '|'.join(
+        re.escape(keyword) for keyword in sorted(_PART_TYPE_BY_TITLE, key=_PART_TYPE_BY_TITLE.get)))
 
     def __init__(self, output_dir):
         self.output_dir = output_dir
+        self._output_abs = os.path.abspath(output_dir)
         self.master_index = []
         self.folder_readmes = defaultdict(list)
         self.index_file = os.path.join(output_dir, 'GunCAD_Master_Index.xlsx')
         self.index_file_csv = os.path.join(output_dir, 'GunCAD_Master_Index.csv')
+        # Rows added since the last full write; appended here during a run and
+        # folded back in by the next full write or the next load
+        self.pending_index_file = os.path.join(output_dir, 'GunCAD_Master_Index.pending.csv')
+        self._pending_entries = []
+        # Guards master_index and the pending rows while entries are processed in parallel
+        self._lock = threading.RLock()
+        
+        # Rule handlers in priority order, and each tag's highest-priority rule
+        rules = [(trigger_tags, getattr(self, name)) for trigger_tags, name in self.TAG_RULES]
+        rules.extend(
+            (trigger_tags, functools.partial(self._categorize_accessory, folder, label, prefer_part_type))
+            for trigger_tags, folder, label, prefer_part_type in self.CATEGORY_RULES
+        )
+        self._tag_rules = [handler for _, handler in rules]
+        self._tag_to_rule = {}
+        for priority, (trigger_tags, _) in enumerate(rules):
+            for tag in trigger_tags:
+                self._tag_to_rule.setdefault(tag, priority)
+        self._categorize_cached = functools.lru_cache(maxsize=4096)(self._categorize)
+        
+        # Sorted master_index positions keyed by LBRY URL, file name and location
+        self._idx_by_lbry = {}
+        self._idx_by_name = {}
+        self._idx_by_loc = {}
+        # Folder -> (file name, position) pairs kept sorted for the README listings
+        self._files_by_folder = {}
         
         self.load_existing_index()
+        self._rebuild_index_lookups()
+        self.load_pending_index()
     
     def sanitize_filename(self, filename):
-        return re.sub(r'[<>:"/\\|?*]', '_', filename)
+        return _SANITIZE_RE.sub('_', filename)
 
-    def clean_for_excel(self, text):
+    @staticmethod
+    def clean_for_excel(text):
         """Remove illegal characters for Excel cells while preserving content"""
         if not text:
             return ""
@@ -670,14 +1057,8 @@ class IntentBasedOrganizer:
         # Convert to string if not already
         text = str(text)
 
-        # Remove only truly illegal characters (control chars below ASCII 32, except newline/tab/return)
-        # Keep printable characters and convert line breaks to spaces
-        cleaned = ''.join(char if ord(char) >= 32 or char in '\n\r\t' else ' ' for char in text)
-
-        # Normalize whitespace but preserve the text
-        cleaned = cleaned.replace('\r\n', '\n').replace('\r', '\n')
-        cleaned = cleaned.replace('\n', ' ')
-        cleaned = cleaned.replace('\t', ' ')
+        # Replace illegal control characters and line breaks/tabs with spaces in one pass
+        cleaned = text.translate(_EXCEL_CONTROL_TO_SPACE)
 
         # Collapse multiple spaces but don't truncate
         cleaned = ' '.join(cleaned.split())
@@ -727,15 +1108,18 @@ class IntentBasedOrganizer:
         if os.path.exists(self.index_file):
             try:
                 import openpyxl
-                wb = openpyxl.load_workbook(self.index_file)
-                ws = wb.active
-                
-                headers = [cell.value for cell in ws[1]]
-                
-                for row in ws.iter_rows(min_row=2, values_only=True):
-                    if row[0]:
-                        entry = dict(zip(headers, row))
-                        self.master_index.append(entry)
+                # Read-only mode streams rows instead of building every cell object
+                wb = openpyxl.load_workbook(self.index_file, read_only=True, data_only=True)
+                try:
+                    rows = wb.active.iter_rows(values_only=True)
+                    headers = next(rows, ())
+                    
+                    for row in rows:
+                        if row and row[0]:
+                            entry = self._clean_entry(dict(zip(headers, row)))
+                            self.master_index.append(entry)
+                finally:
+                    wb.close()
                 
                 print(f"✓ Loaded existing index: {len(self.master_index)} files")
                 self.reconcile_moved_files()
@@ -748,7 +1132,7 @@ class IntentBasedOrganizer:
                 import csv
                 with open(self.index_file_csv, 'r', encoding='utf-8') as f:
                     reader = csv.DictReader(f)
-                    self.master_index = list(reader)
+                    self.master_index = [self._clean_entry(entry) for entry in reader]
                 
                 print(f"✓ Loaded existing index: {len(self.master_index)} files")
                 self.reconcile_moved_files()
@@ -758,6 +1142,26 @@ class IntentBasedOrganizer:
         
         print("  No existing index found - starting fresh")
     
+    def load_pending_index(self):
+        """Replay rows journaled by a run that ended before its final index write"""
+        if not os.path.exists(self.pending_index_file):
+            return
+        
+        try:
+            import csv
+            count = 0
+            with open(self.pending_index_file, 'r', newline='', encoding='utf-8') as f:
+                for entry in csv.DictReader(f):
+                    for key in ('Odysee Views', 'Odysee Likes', 'Odysee Dislikes'):
+                        if entry.get(key, '').isdigit():
+                            entry[key] = int(entry[key])
+                    self._store_entry(self._clean_entry(entry))
+                    count += 1
+            
+            print(f"✓ Recovered {count} index rows from the last run")
+        except Exception as e:
+            print(f"  Warning: Could not load pending index rows: {e}")
+    
     def reconcile_moved_files(self):
         """Update file paths in index ONLY for files within the current output directory"""
         print("  🔄 Checking for moved files within output directory...")
@@ -765,6 +1169,7 @@ class IntentBasedOrganizer:
         updated_count = 0
         outside_dir_count = 0
         missing_count = 0
+        files_by_name = None
         
         for entry in self.master_index:
             old_path = entry.get('Location', '')
@@ -776,8 +1181,7 @@ class IntentBasedOrganizer:
             if os.path.exists(old_path):
                 try:
                     file_abs = os.path.abspath(old_path)
-                    output_abs = os.path.abspath(self.output_dir)
-                    rel_path = os.path.relpath(file_abs, output_abs)
+                    rel_path = os.path.relpath(file_abs, self._output_abs)
                     
                     if not rel_path.startswith('..'):
                         continue
@@ -788,23 +1192,26 @@ class IntentBasedOrganizer:
                     outside_dir_count += 1
                     continue
             
-            for root, dirs, files in os.walk(self.output_dir):
-                if filename in files:
-                    new_path = os.path.join(root, filename)
+            # Scan the output directory once, only when something is missing
+            if files_by_name is None:
+                files_by_name = index_files(self.output_dir)
+            
+            for match in files_by_name.get(filename, []):
+                new_path = self.clean_for_excel(match['path'])
+                
+                old_size_str = entry.get('File Size (MB)', '0')
+                try:
+                    old_size = float(old_size_str) * 1024 * 1024
+                    new_size = match['size']
                     
-                    old_size_str = entry.get('File Size (MB)', '0')
-                    try:
-                        old_size = float(old_size_str) * 1024 * 1024
-                        new_size = os.path.getsize(new_path)
-                        
-                        if abs(new_size - old_size) < (old_size * 0.01):
-                            entry['Location'] = new_path
-                            updated_count += 1
-                            break
-                    except:
+                    if abs(new_size - old_size) < (old_size * 0.01):
                         entry['Location'] = new_path
                         updated_count += 1
                         break
+                except:
+                    entry['Location'] = new_path
+                    updated_count += 1
+                    break
             else:
                 missing_count += 1
         
@@ -820,14 +1227,19 @@ class IntentBasedOrganizer:
     
     def categorize_file(self, title, tags, description):
         """Determine what category this file belongs to based on intent"""
-        
-        gun_model = self.identify_gun_model(tags)
-        caliber = self.identify_caliber(tags)
-        part_type = self.identify_part_type(tags, title)
-        is_complete = self.is_complete_build(tags, title, description)
+        # The description does not affect the category, so it is left out of the cache key
+        return self._categorize_cached(title, tuple(tags))
+    
+    def _categorize(self, title, tags):
+        tag_set = set(tags)
+        title_lower = title.lower()
+        gun_model = self.identify_gun_model(tag_set)
+        caliber = self.identify_caliber(tag_set)
+        part_type = self.identify_part_type(tag_set, title, title_lower)
+        is_complete = self.is_complete_build(tag_set, title, None, title_lower)
         
         if is_complete:
-            if 'Handgun' in tags or 'Pistol' in tags or gun_model in ['Glock', '1911']:
+            if 'Handgun' in tag_set or 'Pistol' in tag_set or gun_model in ['Glock', '1911']:
                 if gun_model:
                     if 'Glock' in gun_model:
                         return (f"Complete_Firearms/Handguns/Glock_Clones/{gun_model}", 
@@ -841,25 +1253,25 @@ class IntentBasedOrganizer:
                 return ("Complete_Firearms/Handguns/Other_Handguns", 
                        gun_model, caliber, 'Complete Build')
             
-            elif 'Rifle' in tags or 'AR-15' in tags or 'AK-47' in tags:
-                if 'AR-15' in tags or 'AR-15' in title:
+            elif 'Rifle' in tag_set or 'AR-15' in tag_set or 'AK-47' in tag_set:
+                if 'AR-15' in tag_set or 'AR-15' in title:
                     return ("Complete_Firearms/Rifles/AR-15_Builds", 
                            'AR-15', caliber, 'Complete Build')
-                elif 'AR-22' in tags or 'AR-22' in title:
+                elif 'AR-22' in tag_set or 'AR-22' in title:
                     return ("Complete_Firearms/Rifles/AR-22_Builds", 
                            'AR-22', caliber, 'Complete Build')
-                elif 'AK' in str(tags):
+                elif any('AK' in tag for tag in tag_set):
                     return ("Complete_Firearms/Rifles/AK_Builds", 
                            'AK-47', caliber, 'Complete Build')
                 else:
                     return ("Complete_Firearms/Rifles/Other_Rifles", 
                            gun_model, caliber, 'Complete Build')
             
-            elif 'PCC' in tags:
+            elif 'PCC' in tag_set:
                 return ("Complete_Firearms/PCCs", 
                        gun_model, caliber, 'Complete Build')
             
-            elif 'Shotgun' in tags:
+            elif 'Shotgun' in tag_set:
                 return ("Complete_Firearms/Shotguns", 
                        gun_model, caliber, 'Complete Build')
         
@@ -885,86 +1297,81 @@ class IntentBasedOrganizer:
                 return (f"Parts_and_Upgrades/Uppers_and_Slides/Other_Uppers", 
                        gun_model, caliber, part_type)
         
-        if 'FRT' in tags or 'Trigger' in tags:
-            return (f"Parts_and_Upgrades/Fire_Control/{'FRTs' if 'FRT' in tags else 'Triggers'}", 
-                   gun_model, caliber, 'Fire Control')
+        triggered = [self._tag_to_rule[tag] for tag in tag_set if tag in self._tag_to_rule]
+        if triggered:
+            return self._tag_rules[min(triggered)](tag_set, gun_model, caliber, part_type)
         
-        if 'Barrel' in tags or 'Bolt' in tags or 'DIY Barrel' in tags:
-            return (f"Parts_and_Upgrades/Barrels_and_Bolts", 
-                   gun_model, caliber, part_type)
-        
-        if 'Suppressor' in tags:
-            if caliber in ['9x19mm', '.45 ACP', '22 Long Rifle']:
-                cal_folder = caliber.replace(' ', '_').replace('.', '')
-                return (f"Accessories/By_Function/Suppressors/Pistol_Caliber/{cal_folder}", 
-                       gun_model, caliber, 'Suppressor')
-            else:
-                cal_folder = caliber.replace(' ', '_').replace('.', '') if caliber else 'Multi_Caliber'
-                return (f"Accessories/By_Function/Suppressors/Rifle_Caliber/{cal_folder}", 
-                       gun_model, caliber, 'Suppressor')
-        
-        if 'Magazine' in tags:
-            if gun_model:
-                model_folder = gun_model.replace(' ', '_')
-                return (f"Accessories/By_Function/Magazines/By_Gun/{model_folder}_Magazines", 
-                       gun_model, caliber, 'Magazine')
-            elif caliber:
-                cal_folder = caliber.replace(' ', '_').replace('.', '')
-                return (f"Accessories/By_Function/Magazines/By_Caliber/{cal_folder}", 
-                       gun_model, caliber, 'Magazine')
-            else:
-                return (f"Accessories/By_Function/Magazines/Other", 
-                       gun_model, caliber, 'Magazine')
-        
-        if 'Sight' in tags or 'Optic' in tags:
-            return (f"Accessories/By_Function/Optics_and_Sights", 
-                   gun_model, caliber, 'Optic/Sight')
-        
-        if 'Muzzle Device' in tags:
-            return (f"Accessories/By_Function/Muzzle_Devices", 
-                   gun_model, caliber, 'Muzzle Device')
-        
-        if 'Stock' in tags or 'Grip' in tags or 'Pistol Brace' in tags:
-            return (f"Accessories/By_Function/Grips_and_Stocks", 
-                   gun_model, caliber, part_type or 'Stock/Grip')
-        
-        if 'Furniture' in tags or 'Handguard' in tags or 'Foregrip' in tags:
-            return (f"Furniture", gun_model, caliber, 'Furniture')
-        
-        if 'Jig' in title or 'Jig' in tags or 'Fixture' in title:
-            if 'Bending' in title:
+        tool_words = set(_TOOL_TITLE_RE.findall(title))
+        if 'Jig' in tool_words or 'Jig' in tag_set or 'Fixture' in tool_words:
+            if 'Bending' in tool_words:
                 return (f"Tools_and_Jigs/Bending_Jigs", gun_model, caliber, 'Jig')
-            elif 'Drill' in title:
+            elif 'Drill' in tool_words:
                 return (f"Tools_and_Jigs/Drilling_Jigs", gun_model, caliber, 'Jig')
-            elif 'CNC' in title or 'CNC' in tags:
+            elif 'CNC' in tool_words or 'CNC' in tag_set:
                 return (f"Tools_and_Jigs/CNC_Fixtures", gun_model, caliber, 'CNC Fixture')
             else:
                 return (f"Tools_and_Jigs/Assembly_Tools", gun_model, caliber, 'Tool')
         
         if gun_model:
-            model_folder = gun_model.replace(' ', '_')
+            model_folder = gun_model.translate(_MODEL_FOLDER_TABLE)
             return (f"Miscellaneous/By_Gun_Model/{model_folder}", 
                    gun_model, caliber, 'Other')
         elif caliber:
-            cal_folder = caliber.replace(' ', '_').replace('.', '')
+            cal_folder = caliber.translate(_CALIBER_FOLDER_TABLE)
             return (f"Miscellaneous/By_Caliber/{cal_folder}", 
                    gun_model, caliber, 'Other')
         else:
             return (f"Miscellaneous/Uncategorized", 
                    gun_model, caliber, 'Other')
     
-    def is_complete_build(self, tags, title, description):
-        complete_indicators = [
-            'Complete', 'Full Build', 'Full Gun', 'DIY Fire Control',
-            'DIY Bolt', 'Printed Firearm', 'No Firearm Parts'
-        ]
+    def _categorize_fire_control(self, tag_set, gun_model, caliber, part_type):
+        return (f"Parts_and_Upgrades/Fire_Control/{'FRTs' if 'FRT' in tag_set else 'Triggers'}", 
+               gun_model, caliber, 'Fire Control')
+    
+    def _categorize_barrel(self, tag_set, gun_model, caliber, part_type):
+        return (f"Parts_and_Upgrades/Barrels_and_Bolts", 
+               gun_model, caliber, part_type)
+    
+    def _categorize_suppressor(self, tag_set, gun_model, caliber, part_type):
+        if caliber in ['9x19mm', '.45 ACP', '22 Long Rifle']:
+            cal_folder = caliber.translate(_CALIBER_FOLDER_TABLE)
+            return (f"Accessories/By_Function/Suppressors/Pistol_Caliber/{cal_folder}", 
+                   gun_model, caliber, 'Suppressor')
+        else:
+            cal_folder = caliber.translate(_CALIBER_FOLDER_TABLE) if caliber else 'Multi_Caliber'
+            return (f"Accessories/By_Function/Suppressors/Rifle_Caliber/{cal_folder}", 
+                   gun_model, caliber, 'Suppressor')
+    
+    def _categorize_magazine(self, tag_set, gun_model, caliber, part_type):
+        if gun_model:
+            model_folder = gun_model.translate(_MODEL_FOLDER_TABLE)
+            return (f"Accessories/By_Function/Magazines/By_Gun/{model_folder}_Magazines", 
+                   gun_model, caliber, 'Magazine')
+        elif caliber:
+            cal_folder = caliber.translate(_CALIBER_FOLDER_TABLE)
+            return (f"Accessories/By_Function/Magazines/By_Caliber/{cal_folder}", 
+                   gun_model, caliber, 'Magazine')
+        else:
+            return (f"Accessories/By_Function/Magazines/Other", 
+                   gun_model, caliber, 'Magazine')
+    
+    def _categorize_accessory(self, folder, label, prefer_part_type,
+                              tag_set, gun_model, caliber, part_type):
+        return (folder, gun_model, caliber,
+               (part_type or label) if prefer_part_type else label)
+    
+    def is_complete_build(self, tags, title, description, title_lower=None):
+        if not self.COMPLETE_INDICATORS.isdisjoint(tags):
+            return True
         
-        for indicator in complete_indicators:
-            if indicator in tags or indicator.lower() in title.lower():
-                return True
+        if title_lower is None:
+            title_lower = title.lower()
+        
+        if any(indicator in title_lower for indicator in self._COMPLETE_INDICATORS_LOWER):
+            return True
         
-        has_frame = any(x in tags for x in ['Frame/Receiver', 'Frame', 'Receiver'])
-        has_other_parts = any(x in tags for x in ['Upper', 'Barrel', 'Bolt', 'Slide'])
+        has_frame = not self.FRAME_TAGS.isdisjoint(tags)
+        has_other_parts = not self.OTHER_PART_TAGS.isdisjoint(tags)
         
         if has_frame and has_other_parts:
             return True
@@ -972,62 +1379,21 @@ class IntentBasedOrganizer:
         return False
     
     def identify_gun_model(self, tags):
-        models = {
-            'Glock 19': ['Glock 19'],
-            'Glock 17': ['Glock 17'],
-            'Glock 26': ['Glock 26'],
-            'Glock 43': ['Glock 43'],
-            'Glock 48': ['Glock 48'],
-            'Glock': ['Glock'],
-            'AR-15': ['AR-15'],
-            'AR-22': ['AR-22'],
-            'AR-10': ['AR-10'],
-            'AK-47': ['AK-47', 'AK-74'],
-            'FGC-9': ['FGC-9'],
-            '1911': ['1911'],
-            'TX22': ['TX22'],
-            'Taurus': ['Taurus']
-        }
-        
-        for model_name, keywords in models.items():
-            for keyword in keywords:
-                if keyword in tags:
-                    return model_name
-        
-        return None
+        matches = [self._MODEL_BY_TAG[tag] for tag in tags if tag in self._MODEL_BY_TAG]
+        return min(matches)[1] if matches else None
     
     def identify_caliber(self, tags):
-        calibers = ['9x19mm', '22 Long Rifle', '.45 ACP', '5.56x45mm', 
-                   '7.62x39mm', '.308 Winchester', '12 Gauge']
-        
-        for cal in calibers:
-            if cal in tags:
-                return cal
-        
-        return None
+        matches = [tag for tag in tags if tag in self._CALIBER_PRIORITY]
+        return min(matches, key=self._CALIBER_PRIORITY.get) if matches else None
     
-    def identify_part_type(self, tags, title):
-        part_types = {
-            'Frame': ['Frame/Receiver', 'Frame'],
-            'Receiver': ['Receiver'],
-            'Lower': ['Lower'],
-            'Upper': ['Upper'],
-            'Slide': ['Slide'],
-            'Barrel': ['Barrel', 'DIY Barrel'],
-            'Bolt': ['Bolt', 'DIY Bolt'],
-            'Trigger': ['Trigger'],
-            'Stock': ['Stock'],
-            'Grip': ['Grip', 'Pistol Grip'],
-            'Magazine': ['Magazine'],
-            'Suppressor': ['Suppressor'],
-        }
-        
-        for part_name, keywords in part_types.items():
-            for keyword in keywords:
-                if keyword in tags or keyword.lower() in title.lower():
-                    return part_name
-        
-        return None
+    def identify_part_type(self, tags, title, title_lower=None):
+        if title_lower is None:
+            title_lower = title.lower()
+        
+        matches = [self._PART_TYPE_BY_TAG[tag] for tag in tags if tag in self._PART_TYPE_BY_TAG]
+        matches.extend(self._PART_TYPE_BY_TITLE[keyword]
+                       for keyword in self._PART_TYPE_TITLE_RE.findall(title_lower))
+        return min(matches)[1] if matches else None
     
     def get_folder_path(self, title, tags, description):
         category_path, gun_model, caliber, part_type = self.categorize_file(title, tags, description)
@@ -1055,15 +1421,7 @@ class IntentBasedOrganizer:
 
         print(f"  DEBUG: Description split into {len([c for c in desc_chunks if c])} chunk(s)")
 
-        existing_idx = None
-        for idx, entry in enumerate(self.master_index):
-            if (entry.get('LBRY URL') == lbry_url and lbry_url) or \
-                    entry.get('File Name') == filename or \
-                    entry.get('Location') == filepath:
-                existing_idx = idx
-                break
-
-        new_entry = {
+        new_entry = self._clean_entry({
             'File Name': filename,
             'Location': filepath,
             'LBRY URL': lbry_url,
@@ -1078,10 +1436,13 @@ class IntentBasedOrganizer:
             'Last Updated': last_updated or '',
             'Author': author or '',
             'Version': version or '',
-            'Date Downloaded': datetime.now().strftime('%Y-%m-%d %H:%M'),
+            'Date Downloaded': minute_timestamp(),
             'Odysee Views': odysee_views or 0,
             'Odysee Likes': odysee_likes or 0,
-            'Odysee Dislikes': odysee_dislikes or 0,
+            'Odysee Dislikes': odysee_dislikes or 0
+        })
+        # split_for_excel has already cleaned the text chunks
+        new_entry.update({
             'Description': desc_chunks[0],
             'Description (cont.)': desc_chunks[1],
             'Description (cont. 2)': desc_chunks[2],
@@ -1089,12 +1450,129 @@ class IntentBasedOrganizer:
             'Notes (cont.)': notes_chunks[1],
             'Readme': readme_chunks[0],
             'Readme (cont.)': readme_chunks[1]
-        }
+        })
 
-        if existing_idx is not None:
+        with self._lock:
+            self._store_entry(new_entry)
+            self._pending_entries.append(new_entry)
+    
+    def _clean_entry(self, entry):
+        """Clean every string field once, so index writers can use values as-is"""
+        for key, value in entry.items():
+            if isinstance(value, str):
+                entry[key] = self.clean_for_excel(value)
+        return entry
+    
+    def _store_entry(self, new_entry):
+        """Replace the first entry matching on LBRY URL, file name or location, or append"""
+        lbry_url = new_entry.get('LBRY URL')
+        candidates = [positions[0] for positions in (
+            self._idx_by_lbry.get(lbry_url) if lbry_url else None,
+            self._idx_by_name.get(new_entry.get('File Name')),
+            self._idx_by_loc.get(new_entry.get('Location')),
+        ) if positions]
+        
+        if candidates:
+            existing_idx = min(candidates)
+            self._remove_index_lookups(existing_idx, self.master_index[existing_idx])
             self.master_index[existing_idx] = new_entry
         else:
+            existing_idx = len(self.master_index)
             self.master_index.append(new_entry)
+        self._add_index_lookups(existing_idx, new_entry)
+    
+    def remove_from_index(self, filepath):
+        """Drop the rows for a file that was deleted after it was indexed"""
+        location = self.clean_for_excel(filepath)
+        with self._lock:
+            positions = self._idx_by_loc.get(location)
+            if not positions:
+                return
+            
+            removed = set(positions)
+            self.master_index = [entry for idx, entry in enumerate(self.master_index)
+                                 if idx not in removed]
+            self._rebuild_index_lookups()
+            
+            self._pending_entries = [entry for entry in self._pending_entries
+                                     if entry.get('Location') != location]
+            self._drop_journaled_rows(location)
+    
+    def _drop_journaled_rows(self, location):
+        """Rewrite the pending journal without the rows for one location"""
+        if not os.path.exists(self.pending_index_file):
+            return
+        
+        import csv
+        
+        with open(self.pending_index_file, 'r', newline='', encoding='utf-8') as f:
+            rows = [row for row in csv.DictReader(f) if row.get('Location') != location]
+        with open(self.pending_index_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=self.COLUMN_ORDER, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(rows)
+    
+    def _rebuild_index_lookups(self):
+        # Positions shift when rows are removed, so every lookup is rebuilt
+        for lookup in (self._idx_by_lbry, self._idx_by_name, self._idx_by_loc, self._files_by_folder):
+            lookup.clear()
+        for idx, entry in enumerate(self.master_index):
+            self._add_index_lookups(idx, entry)
+    
+    def _index_lookups(self, entry):
+        return ((self._idx_by_lbry, entry.get('LBRY URL')),
+                (self._idx_by_name, entry.get('File Name')),
+                (self._idx_by_loc, entry.get('Location')))
+    
+    @staticmethod
+    def _folder_listing_key(idx, entry):
+        return (os.path.dirname(entry.get('Location') or ''),
+                (entry.get('File Name') or '', idx))
+    
+    def _add_index_lookups(self, idx, entry):
+        for lookup, key in self._index_lookups(entry):
+            bisect.insort(lookup.setdefault(key, []), idx)
+        
+        folder, listing = self._folder_listing_key(idx, entry)
+        bisect.insort(self._files_by_folder.setdefault(folder, []), listing)
+    
+    def _remove_index_lookups(self, idx, entry):
+        for lookup, key in self._index_lookups(entry):
+            positions = lookup.get(key)
+            if positions and idx in positions:
+                positions.remove(idx)
+                if not positions:
+                    del lookup[key]
+        
+        folder, listing = self._folder_listing_key(idx, entry)
+        listings = self._files_by_folder.get(folder)
+        if listings and listing in listings:
+            listings.remove(listing)
+            if not listings:
+                del self._files_by_folder[folder]
+    
+    def append_master_index(self):
+        """Journal rows added since the last write without rebuilding the workbook"""
+        with self._lock:
+            pending, self._pending_entries = self._pending_entries, []
+        if not pending:
+            return
+        
+        import csv
+        
+        write_header = not os.path.exists(self.pending_index_file)
+        with open(self.pending_index_file, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=self.COLUMN_ORDER, extrasaction='ignore')
+            if write_header:
+                writer.writeheader()
+            writer.writerows(pending)
+        
+        print(f"✓ Saved {len(pending)} new index rows: {self.pending_index_file}")
+    
+    def _clear_pending_index(self):
+        self._pending_entries = []
+        if os.path.exists(self.pending_index_file):
+            os.remove(self.pending_index_file)
     
     def generate_master_index(self):
         if not self.master_index:
@@ -1102,41 +1580,49 @@ class IntentBasedOrganizer:
         
         try:
             import openpyxl
-            from openpyxl.styles import Font, PatternFill
+            from openpyxl.cell import WriteOnlyCell
+            from openpyxl.styles import Font, NamedStyle, PatternFill
+            from openpyxl.utils import get_column_letter
             
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "GunCAD Master Index"
+            # Write-only mode streams rows to disk, but column widths and
+            # frozen panes must be set before the first row is appended
+            wb = openpyxl.Workbook(write_only=True)
+            ws = wb.create_sheet("GunCAD Master Index")
             
             headers = self.COLUMN_ORDER
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col, value=header)
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                cell.font = Font(bold=True, color="FFFFFF")
+            col_widths = [len(header) for header in headers]
+            rows = []
+            for entry in self.master_index:
+                # Entries are cleaned when they enter the index
+                row = [entry.get(header, '') for header in headers]
+                for col_idx, value in enumerate(row):
+                    if isinstance(value, str) and len(value) > col_widths[col_idx]:
+                        col_widths[col_idx] = len(value)
+                rows.append(row)
             
-            for row_idx, entry in enumerate(self.master_index, 2):
-                for col_idx, header in enumerate(headers, 1):
-                    value = entry.get(header, '')
-                    if isinstance(value, str):
-                        value = self.clean_for_excel(value)
-                    ws.cell(row=row_idx, column=col_idx, value=value)
+            for col_idx, width in enumerate(col_widths, 1):
+                ws.column_dimensions[get_column_letter(col_idx)].width = min(width + 2, 50)
+            ws.freeze_panes = 'A2'
             
-            for column in ws.columns:
-                max_length = 0
-                column = [cell for cell in column]
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(cell.value)
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column[0].column_letter].width = adjusted_width
+            # One registered style shared by every header cell
+            header_style = NamedStyle(
+                name="GunCAD Header",
+                font=Font(bold=True, color="FFFFFF"),
+                fill=PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+            )
+            wb.add_named_style(header_style)
+            header_row = []
+            for header in headers:
+                cell = WriteOnlyCell(ws, value=header)
+                cell.style = header_style.name
+                header_row.append(cell)
+            ws.append(header_row)
             
-            ws.freeze_panes = 'A2'
+            for row in rows:
+                ws.append(row)
             
             wb.save(self.index_file)
+            self._clear_pending_index()
             print(f"\n✓ Master index saved: {self.index_file}")
             
         except ImportError:
@@ -1148,117 +1634,136 @@ class IntentBasedOrganizer:
                     writer.writeheader()
                     writer.writerows(self.master_index)
             
+            self._clear_pending_index()
             print(f"\n✓ Master index saved: {self.index_file_csv}")
     
     def generate_readmes(self):
+        # Every documented folder holds indexed files, so take the folders from
+        # the index instead of walking the whole output tree
+        output_prefix = os.path.join(self.output_dir, '')
+        last_updated = minute_timestamp()
         folders_to_document = set()
-        
-        for root, dirs, files in os.walk(self.output_dir):
-            if root == self.output_dir:
+        for folder in self._files_by_folder:
+            if not folder.startswith(output_prefix):
                 continue
             
-            if any(part.startswith('.') for part in root.split(os.sep)):
+            if _HIDDEN_PATH_RE.search(folder):
                 continue
             
-            cad_files = [f for f in files if not f.startswith('README') and not f.startswith('.')]
-            if cad_files:
-                folders_to_document.add(root)
+            if os.path.isdir(folder):
+                folders_to_document.add(folder)
         
         for folder in folders_to_document:
             readme_path = os.path.join(folder, 'README.md')
-            
-            folder_files = [entry for entry in self.master_index 
-                           if os.path.dirname(entry.get('Location', '')) == folder]
-            
-            if not folder_files:
-                continue
+            # Already sorted by file name, ties in index order
+            folder_files = [self.master_index[idx] for _, idx in self._files_by_folder[folder]]
             
             folder_name = os.path.basename(folder)
             parent_folder = os.path.basename(os.path.dirname(folder))
             
-            gun_models = set(f.get('Gun Model') for f in folder_files if f.get('Gun Model'))
-            calibers = set(f.get('Caliber') for f in folder_files if f.get('Caliber'))
-            part_types = set(f.get('Part Type') for f in folder_files if f.get('Part Type'))
+            gun_models = set()
+            calibers = set()
+            part_types = set()
+            for file_entry in folder_files:
+                if file_entry.get('Gun Model'):
+                    gun_models.add(file_entry['Gun Model'])
+                if file_entry.get('Caliber'):
+                    calibers.add(file_entry['Caliber'])
+                if file_entry.get('Part Type'):
+                    part_types.add(file_entry['Part Type'])
+            
+            # Build the whole README in memory and write it in one call
+            lines = [
+                f"# {folder_name}\n\n",
+                f"**Location:** `{parent_folder}/{folder_name}/`\n\n",
+                f"**Files in this folder:** {len(folder_files)}\n\n",
+            ]
+            
+            if gun_models:
+                lines.append(f"**Gun Models:** {', '.join(sorted(gun_models))}\n\n")
+            
+            if calibers:
+                lines.append(f"**Calibers:** {', '.join(sorted(calibers))}\n\n")
+            
+            if part_types:
+                lines.append(f"**Part Types:** {', '.join(sorted(part_types))}\n\n")
+            
+            lines.append("---\n\n")
+            lines.append("## Files\n\n")
+            for file_entry in folder_files:
+                lines.append(f"- `{file_entry.get('File Name', '')}`")
+                details = []
+                if file_entry.get('Gun Model'):
+                    details.append(file_entry['Gun Model'])
+                if file_entry.get('Caliber'):
+                    details.append(file_entry['Caliber'])
+                if details:
+                    lines.append(f" ({', '.join(details)})")
+                lines.append("\n")
+            
+            lines.append("\n---\n")
+            lines.append(f"*Last updated: {last_updated}*\n")
             
             with open(readme_path, 'w', encoding='utf-8') as f:
-                f.write(f"# {folder_name}\n\n")
-                f.write(f"**Location:** `{parent_folder}/{folder_name}/`\n\n")
-                f.write(f"**Files in this folder:** {len(folder_files)}\n\n")
-                
-                if gun_models:
-                    f.write(f"**Gun Models:** {', '.join(sorted(gun_models))}\n\n")
-                
-                if calibers:
-                    f.write(f"**Calibers:** {', '.join(sorted(calibers))}\n\n")
-                
-                if part_types:
-                    f.write(f"**Part Types:** {', '.join(sorted(part_types))}\n\n")
-                
-                f.write("---\n\n")
-                f.write("## Files\n\n")
-                for file_entry in sorted(folder_files, key=lambda x: x.get('File Name', '')):
-                    f.write(f"- `{file_entry.get('File Name', '')}`")
-                    details = []
-                    if file_entry.get('Gun Model'):
-                        details.append(file_entry['Gun Model'])
-                    if file_entry.get('Caliber'):
-                        details.append(file_entry['Caliber'])
-                    if details:
-                        f.write(f" ({', '.join(details)})")
-                    f.write("\n")
-                
-                f.write("\n---\n")
-                f.write(f"*Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}*\n")
+                f.write(''.join(lines))
         
         print(f"✓ Generated README files in {len(folders_to_document)} folders")
     
     def generate_quick_find(self):
         quick_find_path = os.path.join(self.output_dir, 'QUICK_FIND.txt')
         
+        lines = [
+            "═══════════════════════════════════════════════════════════════════\n",
+            "               GUNCAD COLLECTION QUICK REFERENCE                   \n",
+            "═══════════════════════════════════════════════════════════════════\n\n",
+        
+            "🔫 BUILDING A COMPLETE GUN?\n",
+            "   → /Complete_Firearms/[type]/[model]/\n\n",
+        
+            "🔧 NEED A SPECIFIC PART?\n",
+            "   → /Parts_and_Upgrades/[part_type]/[model]/\n\n",
+        
+            "🎯 LOOKING FOR ACCESSORIES?\n",
+            "   → /Accessories/By_Function/[accessory_type]/\n\n",
+        
+            "📦 BY CALIBER:\n",
+            "   → Search Master Index Excel file for caliber column\n\n",
+        
+            "🔍 CAN'T FIND SOMETHING?\n",
+            "   1. Open GunCAD_Master_Index.xlsx\n",
+            "   2. Use Ctrl+F to search\n",
+            "   3. Check 'Location' column for path\n\n",
+        
+            "═══════════════════════════════════════════════════════════════════\n",
+            "Total Files: {}\n".format(len(self.master_index)),
+            "Last Updated: {}\n".format(minute_timestamp()),
+            "═══════════════════════════════════════════════════════════════════\n",
+        ]
+        
         with open(quick_find_path, 'w', encoding='utf-8') as f:
-            f.write("═══════════════════════════════════════════════════════════════════\n")
-            f.write("               GUNCAD COLLECTION QUICK REFERENCE                   \n")
-            f.write("═══════════════════════════════════════════════════════════════════\n\n")
-            
-            f.write("🔫 BUILDING A COMPLETE GUN?\n")
-            f.write("   → /Complete_Firearms/[type]/[model]/\n\n")
-            
-            f.write("🔧 NEED A SPECIFIC PART?\n")
-            f.write("   → /Parts_and_Upgrades/[part_type]/[model]/\n\n")
-            
-            f.write("🎯 LOOKING FOR ACCESSORIES?\n")
-            f.write("   → /Accessories/By_Function/[accessory_type]/\n\n")
-            
-            f.write("📦 BY CALIBER:\n")
-            f.write("   → Search Master Index Excel file for caliber column\n\n")
-            
-            f.write("🔍 CAN'T FIND SOMETHING?\n")
-            f.write("   1. Open GunCAD_Master_Index.xlsx\n")
-            f.write("   2. Use Ctrl+F to search\n")
-            f.write("   3. Check 'Location' column for path\n\n")
-            
-            f.write("═══════════════════════════════════════════════════════════════════\n")
-            f.write("Total Files: {}\n".format(len(self.master_index)))
-            f.write("Last Updated: {}\n".format(datetime.now().strftime('%Y-%m-%d %H:%M')))
-            f.write("═══════════════════════════════════════════════════════════════════\n")
+            f.write(''.join(lines))
         
         print(f"✓ Quick find guide saved: {quick_find_path}")
 
 
 class GunCADDownloaderV6:
-    def __init__(self, output_dir='downloads', max_wait_time=300, batch_update_interval=10, excluded_tags=None):
+    def __init__(self, output_dir='downloads', max_wait_time=300, batch_update_interval=10, excluded_tags=None,
+                 download_workers=1, deep_zip_check=False):
         self.output_dir = output_dir
         self.organizer = IntentBasedOrganizer(output_dir)
         self.tracker = DownloadTracker(output_dir=output_dir, excel_index=self.organizer.master_index)
         self.lbry = LBRYDaemonClient(max_wait_time=max_wait_time)
         self.api = GunCADIndexAPIClient()
-        self.verifier = FileVerifier()
         self.batch_update_interval = batch_update_interval
         self.excluded_tags = excluded_tags or []
+        self._excluded_tag_set = frozenset(self.excluded_tags)
+        self.download_workers = download_workers
+        self.deep_zip_check = deep_zip_check
         
         self.session_successful = 0
         self.session_failed = 0
         self.session_skipped_by_filter = 0
+        self._stats_lock = threading.Lock()
         
         self.start_time = None
         self.total_items = 0
@@ -1291,6 +1796,23 @@ class GunCADDownloaderV6:
         
         print(stats_line)
     
+    def _count_result(self, counter, current_item=None):
+        """Increment one of the session_* counters and print the live stats"""
+        with self._stats_lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+            self.update_live_stats(current_item)
+    
+    def record_verifications(self, wait=False):
+        """Move downloads that failed background verification to the failed count"""
+        failed = self.tracker.collect_verifications(wait=wait)
+        if failed:
+            for filepath in failed:
+                self.organizer.remove_from_index(filepath)
+            with self._stats_lock:
+                self.session_successful -= len(failed)
+                self.session_failed += len(failed)
+                self.update_live_stats()
+    
     def process_entry(self, entry, current_item=None):
         title = self.organizer.sanitize_filename(entry.get('title', 'Unknown'))
         detail_url = entry.get('detail_url', '')
@@ -1303,14 +1825,13 @@ class GunCADDownloaderV6:
         readme = entry.get('readme', '')
         
         # Check if any excluded tags match
-        if self.excluded_tags:
-            for excluded_tag in self.excluded_tags:
-                if excluded_tag in tags:
-                    print(f"  Title: {title}")
-                    print(f"  ⊘ Skipped (filtered by tag: {excluded_tag})")
-                    self.session_skipped_by_filter += 1
-                    self.update_live_stats(current_item)
-                    return None
+        if not self._excluded_tag_set.isdisjoint(tags):
+            # Report the first matching tag in the order the user gave them
+            excluded_tag = next(tag for tag in self.excluded_tags if tag in tags)
+            print(f"  Title: {title}")
+            print(f"  ⊘ Skipped (filtered by tag: {excluded_tag})")
+            self._count_result('session_skipped_by_filter', current_item)
+            return None
         
         print(f"  Title: {title}")
         print(f"  Tags: {', '.join(tags[:5])}{' ...' if len(tags) > 5 else ''}")
@@ -1320,8 +1841,7 @@ class GunCADDownloaderV6:
         if not lbry_url:
             print("  ✗ No LBRY URL")
             self.tracker.mark_failed(detail_url, title, "No LBRY URL", lbry_url='')
-            self.session_failed += 1
-            self.update_live_stats(current_item)
+            self._count_result('session_failed', current_item)
             return None
         
         print(f"  LBRY: {lbry_url}")
@@ -1335,12 +1855,13 @@ class GunCADDownloaderV6:
             expected_filename = None
         
         if expected_filename:
-            existing_path = self.tracker.file_exists_in_cache(expected_filename, entry.get('size', 0))
-            if existing_path:
+            cached = self.tracker.find_in_cache(expected_filename, entry.get('size', 0))
+            if cached:
+                existing_path = cached['path']
                 print(f"  ✓ File already exists: {existing_path}")
                 print(f"  Skipping download, updating records...")
                 
-                file_size = os.path.getsize(existing_path)
+                file_size = cached['size']
                 folder_path, category_info = self.organizer.get_folder_path(title, tags, description)
 
                 self.organizer.add_to_index(
@@ -1364,18 +1885,17 @@ class GunCADDownloaderV6:
                     verified=True, file_size=file_size,
                     category=category_info.get('category'),
                     gun_model=category_info.get('gun_model'),
-                    caliber=category_info.get('caliber')
+                    caliber=category_info.get('caliber'),
+                    lbry_url=lbry_url
                 )
                 
-                self.session_successful += 1
-                self.update_live_stats(current_item)
+                self._count_result('session_successful', current_item)
                 return existing_path
         
         if not self.lbry.available:
             print("  ✗ LBRY daemon not available")
             self.tracker.mark_failed(detail_url, title, "No daemon", lbry_url=lbry_url)
-            self.session_failed += 1
-            self.update_live_stats(current_item)
+            self._count_result('session_failed', current_item)
             return None
         
         download_path = self.lbry.get_file(lbry_url)
@@ -1383,19 +1903,7 @@ class GunCADDownloaderV6:
         if not download_path:
             print("  ✗ Download failed")
             self.tracker.mark_failed(detail_url, title, "Download failed", lbry_url=lbry_url)
-            self.session_failed += 1
-            self.update_live_stats(current_item)
-            return None
-        
-        print("  Verifying file...")
-        is_valid, message = self.verifier.verify_file(download_path)
-        print(f"  {message}")
-        
-        if not is_valid:
-            print("  ✗ Verification failed")
-            self.tracker.mark_failed(detail_url, title, f"Verification: {message}", lbry_url=lbry_url)
-            self.session_failed += 1
-            self.update_live_stats(current_item)
+            self._count_result('session_failed', current_item)
             return None
         
         folder_path, category_info = self.organizer.get_folder_path(title, tags, description)
@@ -1409,8 +1917,10 @@ class GunCADDownloaderV6:
             final_abs = os.path.abspath(final_path)
             
             if download_abs != final_abs:
-                if os.path.exists(final_path):
+                try:
                     os.remove(final_path)
+                except FileNotFoundError:
+                    pass
                 
                 try:
                     shutil.move(download_path, final_path)
@@ -1425,10 +1935,10 @@ class GunCADDownloaderV6:
             else:
                 print(f"  ✓ Already in correct location")
             
-            if not os.path.exists(final_path):
+            # One stat both confirms the move and gives the size for the index
+            file_size = _safe_size(final_path)
+            if file_size is None:
                 raise Exception("File not found at final destination")
-            
-            file_size = os.path.getsize(final_path)
 
             self.organizer.add_to_index(
                 filename, final_path, title, tags, category_info,
@@ -1448,23 +1958,35 @@ class GunCADDownloaderV6:
             
             self.tracker.mark_downloaded(
                 detail_url, title, final_path, tags,
-                verified=True, file_size=file_size,
+                verified=False, file_size=file_size,
                 category=category_info.get('category'),
                 gun_model=category_info.get('gun_model'),
-                caliber=category_info.get('caliber')
+                caliber=category_info.get('caliber'),
+                lbry_url=lbry_url
             )
+            self.tracker.submit_verification(detail_url, title, final_path, lbry_url=lbry_url,
+                                             deep=self.deep_zip_check)
             
-            self.session_successful += 1
-            self.update_live_stats(current_item)
+            self._count_result('session_successful', current_item)
             return final_path
             
         except Exception as e:
             print(f"  ✗ Error organizing: {e}")
             self.tracker.mark_failed(detail_url, title, f"Organize error: {e}", lbry_url=lbry_url)
-            self.session_failed += 1
-            self.update_live_stats(current_item)
+            self._count_result('session_failed', current_item)
             return None
     
+    def _process_and_wait(self, entry, current_item, delay):
+        """Process one entry on a worker thread, then pause before its next entry"""
+        print(f"\n{'='*70}")
+        print(f"[{current_item}/{self.total_items}]")
+        
+        result = self.process_entry(entry, current_item=current_item)
+        
+        if current_item < self.total_items:
+            time.sleep(delay)
+        return result
+    
     def run(self, max_pages=1, delay=3, check_new_only=True):
         print(f"\n{'='*70}")
         print("GunCAD Index Downloader v6 - Quality of Life Edition (FIXED)")
@@ -1474,7 +1996,8 @@ class GunCADDownloaderV6:
         print(f"Pages: {max_pages}")
         print(f"New only: {check_new_only}")
         print(f"Download timeout: {self.lbry.max_wait_time}s")
-        print(f"Excel batch updates: every {self.batch_update_interval} downloads")
+        print(f"Index progress saved: every {self.batch_update_interval} downloads")
+        print(f"Parallel downloads: {self.download_workers}")
         print(f"{'='*70}\n")
         
         if not self.lbry.available:
@@ -1528,24 +2051,40 @@ class GunCADDownloaderV6:
         self.total_items = len(all_entries)
         self.start_time = time.time()
         
-        for i, entry in enumerate(all_entries, 1):
-            print(f"\n{'='*70}")
-            print(f"[{i}/{len(all_entries)}]")
-            
-            self.process_entry(entry, current_item=i)
-            
-            if i % self.batch_update_interval == 0 or i == len(all_entries):
-                print(f"\n📊 Updating Excel index...")
-                self.organizer.generate_master_index()
-                print(f"   (Includes failed downloads sheet)")
-            
-            if i < len(all_entries):
-                time.sleep(delay)
+        try:
+            # Downloads mostly wait on the LBRY daemon, so several run at once
+            with ThreadPoolExecutor(max_workers=self.download_workers) as executor:
+                futures = [executor.submit(self._process_and_wait, entry, i, delay)
+                           for i, entry in enumerate(all_entries, 1)]
+                try:
+                    for completed, future in enumerate(as_completed(futures), 1):
+                        future.result()
+                        
+                        if completed % self.batch_update_interval == 0 or completed == len(futures):
+                            print(f"\n📊 Saving index progress...")
+                            self.record_verifications()
+                            self.tracker.flush_history()
+                            self.organizer.append_master_index()
+                except BaseException:
+                    # Drop queued entries so an interrupt only waits for active downloads
+                    for future in futures:
+                        future.cancel()
+                    raise
+        except BaseException:
+            # Record the checks of finished downloads, or they stay unverified
+            self.record_verifications(wait=True)
+            self.tracker.shutdown_verifications()
+            self.tracker.flush_history()
+            self.organizer.append_master_index()
+            raise
         
         print(f"\n{'='*70}")
         print("Generating supporting files...")
         print(f"{'='*70}\n")
         
+        self.record_verifications(wait=True)
+        self.tracker.shutdown_verifications()
+        self.tracker.flush_history()
         self.organizer.generate_master_index()
         self.organizer.generate_readmes()
         self.organizer.generate_quick_find()
@@ -1583,6 +2122,30 @@ def get_output_directory():
         return default_dir
 
 
+def _prompt_int(default, invalid_message, too_small_message=None, minimum=1):
+    """Read a whole number from the user; blank input returns the default.
+    
+    Numbers below minimum are clamped to it when too_small_message is given,
+    and otherwise treated like invalid input.
+    """
+    user_input = input("> ").strip()
+    
+    if not user_input:
+        return default
+    
+    digits = user_input[1:] if user_input[0] in '+-' else user_input
+    if digits.isdecimal():
+        value = int(user_input)
+        if value >= minimum:
+            return value
+        if too_small_message:
+            print(too_small_message)
+            return minimum
+    
+    print(invalid_message)
+    return default
+
+
 def get_max_pages():
     print("\n" + "="*70)
     print("DOWNLOAD QUANTITY")
@@ -1596,20 +2159,7 @@ def get_max_pages():
     print(f"\nDefault: 999 (download all)")
     print("Press Enter for default, or type a number:")
     
-    user_input = input("> ").strip()
-    
-    if user_input:
-        try:
-            pages = int(user_input)
-            if pages < 1:
-                print("Invalid input. Using default (999).")
-                return 999
-            return pages
-        except ValueError:
-            print("Invalid input. Using default (999).")
-            return 999
-    else:
-        return 999
+    return _prompt_int(999, "Invalid input. Using default (999).")
 
 
 def get_download_timeout():
@@ -1624,53 +2174,71 @@ def get_download_timeout():
     print(f"\nDefault: 300 seconds (5 minutes)")
     print("Press Enter for default, or type seconds:")
     
-    user_input = input("> ").strip()
-    
-    if user_input:
-        try:
-            timeout = int(user_input)
-            if timeout < 1:
-                print("Timeout too short. Using minimum (1s).")
-                return 1
-            return timeout
-        except ValueError:
-            print("Invalid input. Using default (300s).")
-            return 300
-    else:
-        return 300
+    return _prompt_int(300, "Invalid input. Using default (300s).",
+                       too_small_message="Timeout too short. Using minimum (1s).")
 
 
-def get_excluded_tags(api_client):
-    print("\n" + "=" * 70)
-    print("TAG FILTER (OPTIONAL)")
-    print("=" * 70)
+# Tag scans are cached across runs per scan_pages value; after an hour the
+# cache is revalidated against the page 1 ETag
+_TAGS_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'guncad_index', 'tags_cache.json')
+_TAGS_CACHE_TTL = 3600
 
-    print("\nFetching available tags from GunCAD Index...")
-    all_tags = api_client.get_all_tags(scan_pages=20)  # Scan first 10 pages (250 files)
 
-    if all_tags:
-        print(f"\n Found {len(all_tags)} unique tags")
-        print("\nAvailable tags:")
-        print("-" * 70)
-
-        # Display tags in columns for readability
-        cols = 3
-        tags_per_col = (len(all_tags) + cols - 1) // cols
-
-        for i in range(tags_per_col):
-            row_tags = []
-            for col in range(cols):
-                idx = i + col * tags_per_col
-                if idx < len(all_tags):
-                    row_tags.append(f"{all_tags[idx]:<23}")
-            print("  " + " ".join(row_tags))
-
-        print("-" * 70)
+def _load_tags_cache():
+    try:
+        with open(_TAGS_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _valid_tags_entry(cached):
+    """Return a cache entry only if every field has the type written by get_cached_tags"""
+    if not isinstance(cached, dict):
+        return {}
+    ts, etag, tags = cached.get('ts'), cached.get('etag'), cached.get('tags')
+    if (not isinstance(ts, (int, float)) or isinstance(ts, bool)
+            or not (etag is None or isinstance(etag, str))
+            or not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags)):
+        return {}
+    return cached
+
+
+def get_cached_tags(api_client, scan_pages):
+    """Return the tag list from the disk cache, rescanning the API when it has changed"""
+    cache = _load_tags_cache()
+    cached = _valid_tags_entry(cache.get(str(scan_pages)))
+    if cached and time.time() - cached.get('ts', 0) < _TAGS_CACHE_TTL:
+        print("  Using tags cached from a recent scan")
+        return cached.get('tags', [])
+
+    # A stale entry is revalidated with one conditional request for page 1
+    all_tags = api_client.get_all_tags(scan_pages=scan_pages, etag=cached.get('etag'))
+    if all_tags is None:
+        all_tags = cached.get('tags', [])
+        etag = cached.get('etag')
+    elif not all_tags:
+        # The rescan failed; keep using the stale tags and retry next time
+        return cached.get('tags', [])
     else:
-        print("\n Could not fetch tags from API")
-        print("Common tags you might want to exclude:")
-        print("  Furniture, Accessory, Jig, Fixture, Sight, Optic")
-        print("  Stock, Grip, Magazine, Muzzle Device")
+        etag = api_client.tags_etag
+    if all_tags:
+        cache[str(scan_pages)] = {'ts': time.time(), 'etag': etag, 'tags': all_tags}
+        try:
+            os.makedirs(os.path.dirname(_TAGS_CACHE_FILE), exist_ok=True)
+            with open(_TAGS_CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+        except OSError:
+            pass
+    return all_tags
+
+
+_TAG_FILTER_BANNER = "\n" + "=" * 70 + "\nTAG FILTER (OPTIONAL)\n" + "=" * 70 + "\n"
+
+
+def get_excluded_tags(api_client):
+    sys.stdout.write(_TAG_FILTER_BANNER)
 
     print("\nExclude files with specific tags (comma-separated)")
     print("\nExamples:")
@@ -1678,41 +2246,61 @@ def get_excluded_tags(api_client):
     print("  'Magazine,Jig'         - Skip magazines and jigs")
     print("  'Furniture'            - Skip only furniture")
 
-    if all_tags:
-        print("\nTip: Type 'list' to see the tags again")
-
-    print("\nPress Enter to download everything, or type tags to exclude:")
+    print("\nPress Enter to download everything, or type tags (or 'list' to browse):")
 
+    # Tags are only fetched once the user asks to filter, so pressing Enter
+    # skips the API scan entirely
+    all_tags = None
     excluded_tags = []
 
     while True:
         user_input = input("> ").strip()
 
-        if user_input.lower() == 'list' and all_tags:
-            print("\nAvailable tags:")
-            print("-" * 70)
-            for i in range(tags_per_col):
-                row_tags = []
-                for col in range(cols):
-                    idx = i + col * tags_per_col
-                    if idx < len(all_tags):
-                        row_tags.append(f"{all_tags[idx]:<23}")
-                print("  " + " ".join(row_tags))
-            print("-" * 70)
-            print("\nPress Enter to download everything, or type tags to exclude:")
-            continue
-
         # If user just pressed Enter, break out
         if not user_input:
             break
 
-        # Split by comma and clean up whitespace
-        new_tags = [tag.strip() for tag in user_input.split(',') if tag.strip()]
+        if all_tags is None:
+            print("\nFetching available tags from GunCAD Index...")
+            all_tags = get_cached_tags(api_client, scan_pages=20)  # Scan first 20 pages (500 files)
+            all_tags_set = frozenset(all_tags)
+
+            if all_tags:
+                print(f"\n Found {len(all_tags)} unique tags")
+
+                # Display tags in columns for readability; the table is
+                # rendered once and reused each time the user types 'list'
+                cols = 3
+                tags_per_col = (len(all_tags) + cols - 1) // cols
+
+                lines = []
+                for i in range(tags_per_col):
+                    row_tags = [f"{all_tags[idx]:<23}" for idx in range(i, len(all_tags), tags_per_col)]
+                    lines.append("  " + " ".join(row_tags))
+                tag_table = "\n".join(lines)
+
+        if user_input.lower() == 'list':
+            if all_tags:
+                print("\nAvailable tags:")
+                print("-" * 70)
+                print(tag_table)
+                print("-" * 70)
+            else:
+                print("\n Could not fetch tags from API")
+                print("Common tags you might want to exclude:")
+                print("  Furniture, Accessory, Jig, Fixture, Sight, Optic")
+                print("  Stock, Grip, Magazine, Muzzle Device")
+            print("\nPress Enter to download everything, or type tags to exclude:")
+            continue
+
+        # Split by comma; user_input is already stripped, so the separator
+        # regex handles the remaining whitespace and empties are dropped
+        new_tags = [tag for tag in _TAG_SPLIT_RE.split(user_input) if tag]
 
         # Validate that excluded tags exist in the API
         if all_tags:
-            invalid_tags = [tag for tag in new_tags if tag not in all_tags]
-            valid_tags = [tag for tag in new_tags if tag in all_tags]
+            invalid_tags = [tag for tag in new_tags if tag not in all_tags_set]
+            valid_tags = [tag for tag in new_tags if tag in all_tags_set]
 
             if invalid_tags:
                 print(f"\n Error: These tags were not found in the first 250 releases:")
@@ -1741,12 +2329,11 @@ def get_excluded_tags(api_client):
     return []
 
 
-def main():
-    # LEGAL AGREEMENT PROMPT
-    print("\n" + "=" * 70)
-    print("!!! IMPORTANT !!!")
-    print("=" * 70)
-    print("""
+# Written with a single write so the agreement appears in one piece
+_LEGAL_BANNER = "\n" + "=" * 70 + """
+!!! IMPORTANT !!!
+""" + "=" * 70 + """
+
 This script automatically downloads files listed on GunCAD Index which is 
 a search engine for DIY gun designs. It is not for children. By utilizing 
 this script, you acknowledge and agree that:
@@ -1776,10 +2363,16 @@ it. Such jurisdictions may include, but are not limited to:
 - GunCAD Index does not host, control, or distribute any linked content. It 
   is purely an index and search engine. You access any sites linked here at 
   your own risk and subject to their terms and policies
-""")
-    print("=" * 70)
-    print("To continue, type \"I Agree\" and press Enter")
-    print("=" * 70)
+
+""" + "=" * 70 + """
+To continue, type "I Agree" and press Enter
+""" + "=" * 70 + "\n"
+
+
+def main():
+    # LEGAL AGREEMENT PROMPT
+    sys.stdout.write(_LEGAL_BANNER)
+    sys.stdout.flush()
 
     user_response = input("\n> ").strip()
 
@@ -1805,6 +2398,10 @@ it. Such jurisdictions may include, but are not limited to:
     DELAY = 3
     CHECK_NEW_ONLY = True
     BATCH_UPDATE_INTERVAL = 10
+    # Parallel downloads share the console, so their log lines interleave
+    DOWNLOAD_WORKERS = 1
+    # True also CRC-checks every file inside each zip, which reads the whole archive
+    DEEP_ZIP_CHECK = False
     
     print(f"\n✓ Output directory: {OUTPUT_DIR}")
     print(f"✓ Pages to download: {MAX_PAGES} ({MAX_PAGES * 25} files max)")
@@ -1818,7 +2415,9 @@ it. Such jurisdictions may include, but are not limited to:
             OUTPUT_DIR,
             max_wait_time=None,  # Not used anymore
             batch_update_interval=BATCH_UPDATE_INTERVAL,
-            excluded_tags=EXCLUDED_TAGS
+            excluded_tags=EXCLUDED_TAGS,
+            download_workers=DOWNLOAD_WORKERS,
+            deep_zip_check=DEEP_ZIP_CHECK
         )
         # Pass the existing API client to avoid creating a new one
         downloader.api = api_client